@@ -8,12 +8,14 @@ Usage:
 
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+import numpy as np
+import pyarrow as pa
+from pyarrow import csv as pacsv
 from pathlib import Path
 import re
+import io
 from datetime import datetime
+from dashboard_utils import NUMBER_STRIP, upload_digest, session_report, truncate_names, number_columns, csv_bytes
 
 # ============================================================================
 # Page Configuration
@@ -30,75 +32,145 @@ st.set_page_config(
 # Data Loading & Parsing
 # ============================================================================
 
+# Every line of interest is classified by a single pattern: report metadata,
+# a summary bullet or a table row (anything starting with "||")
+_RE_LINE = re.compile(
+    r'\*\*(?P<meta>Generated|Period):\*\* (?P<meta_value>.+)'
+    r'|- \*\*(?P<label>[^*]+):\*\* \$?(?P<value>[0-9,\.]+)'
+    r'|\|\|(?P<row>.*)'
+)
+
+# Summary bullet label -> (summary key, cast)
+SUMMARY_KEYS = {
+    'Total Ad Sets': ('total_adsets', int),
+    'Total Spend': ('total_spend', float),
+    'Total Add to Cart': ('total_atc', int),
+    'Total Initiate Checkout': ('total_ic', int),
+    'Total Purchases': ('total_purchases', int),
+    'Total Revenue': ('total_revenue', float),
+    'Overall ROAS': ('overall_roas', float),
+    'Overall Cost per Add to Cart': ('overall_cost_atc', float),
+    'Overall Cost per Initiate Checkout': ('overall_cost_ic', float),
+    'Overall Cost per Purchase': ('overall_cost_purchase', float),
+}
+
+ADSET_TABLE_HEADER = ' Ad Set Name | Status | Spend |'
+
+# Ad set table columns, in table order
+ADSET_COLUMNS = ['name', 'status', 'spend', 'atc', 'cost_atc', 'ic', 'cost_ic', 'purchases', 'cost_purchase', 'roas']
+ADSET_INT_COLUMNS = ['atc', 'ic', 'purchases']
+ADSET_FLOAT_COLUMNS = ['spend', 'cost_atc', 'cost_ic', 'cost_purchase', 'roas']
+
+def read_table_block(block, column_names, **convert_options):
+    """Read "|"-separated table rows with the Arrow CSV reader, skipping rows with the wrong cell count"""
+    return pacsv.read_csv(
+        pa.BufferReader(block.encode('utf-8')),
+        read_options=pacsv.ReadOptions(column_names=column_names),
+        parse_options=pacsv.ParseOptions(
+            delimiter='|',
+            quote_char=False,
+            invalid_row_handler=lambda row: 'skip'
+        ),
+        convert_options=pacsv.ConvertOptions(**convert_options)
+    )
+
+def parse_adset_table(rows, width):
+    """Parse ad set table rows (between the leading "||" and closing "|") with width cells each into a DataFrame"""
+    if not rows or width < len(ADSET_COLUMNS):
+        return pd.DataFrame(columns=ADSET_COLUMNS)
+    
+    # Columns past the known ones are read by name but never used
+    column_names = ADSET_COLUMNS + [f'extra_{i}' for i in range(width - len(ADSET_COLUMNS))]
+    block = '\n'.join(rows)
+    
+    # Numeric columns come from a copy with "$", "," and "x" removed so Arrow does the casting
+    try:
+        numeric = read_table_block(block.translate(NUMBER_STRIP), column_names, include_columns=ADSET_COLUMNS[2:])
+    except pa.ArrowInvalid:
+        return pd.DataFrame(columns=ADSET_COLUMNS)
+    
+    text = read_table_block(
+        block,
+        column_names,
+        include_columns=ADSET_COLUMNS[:2],
+        column_types={'name': pa.string(), 'status': pa.string()}
+    )
+    
+    # Arrow-backed strings keep the name/status string ops in C++ kernels
+    text = text.to_pandas(types_mapper={pa.string(): pd.StringDtype('pyarrow')}.get)
+    numeric = numeric.to_pandas()
+    
+    # A malformed cell leaves its whole column as text
+    for col in numeric.columns:
+        if numeric[col].dtype == object:
+            numeric[col] = pd.to_numeric(numeric[col], errors='coerce')
+    
+    df = pd.concat([text.apply(lambda col: col.str.strip()), numeric], axis=1)
+    
+    # Rows with a missing or unparseable cell, or a fractional count, are
+    # skipped, as before
+    valid = (
+        numeric.notna().all(axis=1)
+        & (numeric[ADSET_INT_COLUMNS] % 1 == 0).all(axis=1)
+        & (df['name'] != '')
+        & (df['status'] != '')
+    )
+    df = df.loc[valid].reset_index(drop=True)
+    
+    return df.astype({col: 'int64' for col in ADSET_INT_COLUMNS} | {col: 'float64' for col in ADSET_FLOAT_COLUMNS})
+
 @st.cache_data(ttl=300)
-def parse_adset_report(content):
-    """Parse the ad set testing report markdown"""
+def parse_adset_report(cache_key, _report_file):
+    """Parse the ad set testing report in one pass over the lines of _report_file, cached on cache_key"""
     data = {
         'metadata': {},
         'summary': {},
-        'campaigns': [],
-        'all_adsets': [],
-        'top_by_roas': [],
-        'top_by_spend': []
+        'all_adsets': pd.DataFrame(columns=ADSET_COLUMNS)
     }
     
-    # Extract metadata
-    generated = re.search(r'\*\*Generated:\*\* (.+?)$', content, re.MULTILINE)
-    if generated:
-        data['metadata']['generated'] = generated.group(1)
-    
-    period = re.search(r'\*\*Period:\*\* (.+?)$', content, re.MULTILINE)
-    if period:
-        data['metadata']['period'] = period.group(1)
-    
-    # Extract summary
-    summary_patterns = {
-        'total_adsets': r'- \*\*Total Ad Sets:\*\* ([0-9,]+)',
-        'total_spend': r'- \*\*Total Spend:\*\* \$([0-9,\.]+)',
-        'total_atc': r'- \*\*Total Add to Cart:\*\* ([0-9,]+)',
-        'total_ic': r'- \*\*Total Initiate Checkout:\*\* ([0-9,]+)',
-        'total_purchases': r'- \*\*Total Purchases:\*\* ([0-9,]+)',
-        'total_revenue': r'- \*\*Total Revenue:\*\* \$([0-9,\.]+)',
-        'overall_roas': r'- \*\*Overall ROAS:\*\* ([0-9\.]+)x',
-        'overall_cost_atc': r'- \*\*Overall Cost per Add to Cart:\*\* \$([0-9,\.]+)',
-        'overall_cost_ic': r'- \*\*Overall Cost per Initiate Checkout:\*\* \$([0-9,\.]+)',
-        'overall_cost_purchase': r'- \*\*Overall Cost per Purchase:\*\* \$([0-9,\.]+)'
-    }
+    # None -> outside a table, 'header' -> expecting the separator, 'rows' -> inside a table
+    table_state = None
+    table_rows = []
+    table_width = 0
     
-    for key, pattern in summary_patterns.items():
-        match = re.search(pattern, content)
-        if match:
-            value = match.group(1).replace(',', '')
-            if 'cost' in key or 'roas' in key or 'revenue' in key or 'spend' in key:
-                data['summary'][key] = float(value)
-            else:
-                data['summary'][key] = int(value)
-    
-    # Parse ad set tables (simplified - extract from markdown tables)
-    table_pattern = r'\|\| Ad Set Name \| Status \| Spend \|.+?\n\|\|[-\|]+\n((?:\|\|.+?\n)+)'
-    tables = re.finditer(table_pattern, content)
-    
-    for table in tables:
-        rows = table.group(1).strip().split('\n')
-        for row in rows:
-            parts = [p.strip() for p in row.split('|') if p.strip()]
-            if len(parts) >= 10:
-                try:
-                    adset = {
-                        'name': parts[0],
-                        'status': parts[1],
-                        'spend': float(parts[2].replace('$', '').replace(',', '')),
-                        'atc': int(parts[3].replace(',', '')),
-                        'cost_atc': float(parts[4].replace('$', '').replace(',', '')),
-                        'ic': int(parts[5].replace(',', '')),
-                        'cost_ic': float(parts[6].replace('$', '').replace(',', '')),
-                        'purchases': int(parts[7].replace(',', '')),
-                        'cost_purchase': float(parts[8].replace('$', '').replace(',', '')),
-                        'roas': float(parts[9].replace('x', ''))
-                    }
-                    data['all_adsets'].append(adset)
-                except (ValueError, IndexError):
-                    continue
+    for line in _report_file:
+        # Leading whitespace is skipped so indented bullets still count, as with a search
+        match = _RE_LINE.match(line.lstrip().rstrip('\n'))
+        if not match:
+            table_state = None
+            continue
+        
+        row = match.group('row')
+        if row is None:
+            table_state = None
+            
+            if match.group('meta'):
+                # First occurrence wins, same as a plain search would
+                data['metadata'].setdefault(match.group('meta').lower(), match.group('meta_value'))
+            elif match.group('label') in SUMMARY_KEYS:
+                key, cast = SUMMARY_KEYS[match.group('label')]
+                if key not in data['summary']:
+                    try:
+                        data['summary'][key] = cast(match.group('value').translate(NUMBER_STRIP))
+                    except ValueError:
+                        pass
+            continue
+        
+        # Table lines
+        if row.startswith(ADSET_TABLE_HEADER):
+            table_state = 'header'
+            # The first header decides how many cells a row must have
+            if not table_width:
+                table_width = row.rstrip().removesuffix('|').count('|') + 1
+        elif table_state == 'header':
+            table_state = 'rows' if row and not row.strip('-|') else None
+        elif table_state == 'rows':
+            # Without the closing "|" a row splits into exactly its cells;
+            # cells past the header's width are ignored, as before
+            cells = row.rstrip().removesuffix('|').split('|', table_width)
+            table_rows.append('|'.join(cells[:table_width]))
+    
+    data['all_adsets'] = parse_adset_table(table_rows, table_width)
     
     return data
 
@@ -148,11 +220,19 @@ with st.sidebar:
     
     st.markdown("---")
     
+    # Only a session start or a report (re)load moves the timestamp, so the
+    # captions do not change on every rerun
+    if 'last_refresh' not in st.session_state:
+        st.session_state.last_refresh = datetime.now()
+    
     if st.button("🔄 Refresh Data", type="primary"):
         st.cache_data.clear()
+        st.session_state.pop('adset_report', None)
         st.rerun()
     
-    st.caption(f"⏰ Last updated: {datetime.now().strftime('%H:%M:%S')}")
+    # Filled in again below when a report is loaded on this run
+    last_updated = st.empty()
+    last_updated.caption(f"⏰ Last updated: {st.session_state.last_refresh.strftime('%H:%M:%S')}")
 
 # ============================================================================
 # Load Data
@@ -162,25 +242,47 @@ if selected_source is None:
     st.warning("⬅️ Please select or upload a report to continue")
     st.stop()
 
+# Lines are decoded while the parser reads them, so reading, decoding and
+# parsing share one try; each failure has its own typed handler below
 try:
     if selected_source == "upload":
-        report_content = selected_file.read().decode('utf-8')
-        st.success(f"✅ Loaded uploaded report: **{selected_file.name}**")
+        cache_key = upload_digest(selected_file)
     else:
-        with open(selected_file, 'r', encoding='utf-8') as f:
-            report_content = f.read()
+        stat = selected_file.stat()
+        cache_key = f"{selected_file}:{stat.st_mtime_ns}:{stat.st_size}"
     
-    data = parse_adset_report(report_content)
-    data_loaded = True
+    def load_report():
+        """Parse the selected report, decoding lines as the parser reads them"""
+        if selected_source == "upload":
+            report_file = io.TextIOWrapper(selected_file, encoding='utf-8')
+            try:
+                report = parse_adset_report(cache_key, report_file)
+            finally:
+                # The upload belongs to Streamlit, so unwrap it rather than closing it
+                report_file.detach()
+                selected_file.seek(0)
+        else:
+            with open(selected_file, 'r', encoding='utf-8') as report_file:
+                report = parse_adset_report(cache_key, report_file)
+        
+        st.session_state.last_refresh = datetime.now()
+        last_updated.caption(f"⏰ Last updated: {st.session_state.last_refresh.strftime('%H:%M:%S')}")
+        return report
     
-except Exception as e:
+    data = session_report('adset_report', ('adset', selected_file.name, cache_key), load_report)
+except UnicodeDecodeError:
+    st.error("❌ Error loading report: the file is not valid UTF-8 text")
+    st.stop()
+except OSError as e:
     st.error(f"❌ Error loading report: {e}")
-    with st.expander("Show error details"):
-        st.exception(e)
-    data_loaded = False
-
-if not data_loaded:
     st.stop()
+except ValueError as e:
+    # Includes pyarrow's ArrowInvalid (a ValueError) from a malformed ad set table
+    st.error(f"❌ Error parsing report: {e}")
+    st.stop()
+
+if selected_source == "upload":
+    st.success(f"✅ Loaded uploaded report: **{selected_file.name}**")
 
 # ============================================================================
 # Header
@@ -273,27 +375,40 @@ with col3:
     )
 
 # Funnel visualization
-funnel_data = pd.DataFrame([
-    {'Stage': 'Add to Cart', 'Count': data['summary'].get('total_atc', 0)},
-    {'Stage': 'Initiate Checkout', 'Count': data['summary'].get('total_ic', 0)},
-    {'Stage': 'Purchases', 'Count': data['summary'].get('total_purchases', 0)},
-])
-
-fig_funnel = go.Figure(go.Funnel(
-    y=funnel_data['Stage'],
-    x=funnel_data['Count'],
-    textposition="inside",
-    textinfo="value+percent initial",
-    marker=dict(color=['#2563EB', '#10B981', '#EF4444']),
-    hovertemplate='<b>%{y}</b><br>Count: %{x:,}<extra></extra>'
-))
-
-fig_funnel.update_layout(
-    title="Conversion Funnel",
-    height=350
-)
+# Figures are cached per report cache key as shared go.Figure objects
+@st.cache_resource(ttl=300)
+def build_funnel_fig(cache_key, _summary):
+    """Plotly figure for the report-wide conversion funnel"""
+    import plotly.graph_objects as go
+    
+    funnel_data = pd.DataFrame([
+        {'Stage': 'Add to Cart', 'Count': _summary.get('total_atc', 0)},
+        {'Stage': 'Initiate Checkout', 'Count': _summary.get('total_ic', 0)},
+        {'Stage': 'Purchases', 'Count': _summary.get('total_purchases', 0)},
+    ])
+    
+    fig_funnel = go.Figure(go.Funnel(
+        y=funnel_data['Stage'],
+        x=funnel_data['Count'],
+        textposition="inside",
+        textinfo="value+percent initial",
+        marker=dict(color=['#2563EB', '#10B981', '#EF4444']),
+        hovertemplate='<b>%{y}</b><br>Count: %{x:,}<extra></extra>'
+    ))
+    
+    fig_funnel.update_layout(
+        title="Conversion Funnel",
+        height=350
+    )
+    
+    return fig_funnel
+
+@st.fragment
+def render_funnel(cache_key, summary):
+    """Funnel chart of the report-wide conversion totals"""
+    st.plotly_chart(build_funnel_fig(cache_key, summary), use_container_width=True)
 
-st.plotly_chart(fig_funnel, use_container_width=True)
+render_funnel(cache_key, data['summary'])
 
 st.markdown("---")
 
@@ -301,73 +416,90 @@ st.markdown("---")
 # Ad Set Performance Analysis
 # ============================================================================
 
-if data['all_adsets']:
-    st.subheader("📈 Ad Set Performance Analysis")
+# Maximum number of ad sets plotted in the scatter (the biggest spenders win)
+MAX_SCATTER_POINTS = 2000
+
+def top_n(df, column, n):
+    """The n rows with the largest values in column, largest first, via an O(N) partition"""
+    if len(df) <= n:
+        return df.sort_values(column, ascending=False, kind='stable')
+    idx = np.argpartition(df[column].to_numpy(), -n)[-n:]
+    return df.iloc[idx].sort_values(column, ascending=False, kind='stable')
+
+@st.cache_resource(ttl=300)
+def build_top_roas_fig(cache_key, _df_adsets):
+    """Plotly figure for the top 10 ad sets by ROAS"""
+    import plotly.graph_objects as go
     
-    df_adsets = pd.DataFrame(data['all_adsets'])
+    top_roas = top_n(_df_adsets, 'roas', 10)[['name', 'spend', 'roas', 'purchases']]
     
-    # Top performers
-    col1, col2 = st.columns(2)
+    fig_roas = go.Figure(go.Bar(
+        y=truncate_names(top_roas['name'], 50),
+        x=top_roas['roas'],
+        orientation='h',
+        marker_color='#10B981',
+        text=top_roas['roas'].apply(lambda x: f'{x:.2f}x'),
+        textposition='outside',
+        hovertemplate='<b>%{y}</b><br>ROAS: %{x:.2f}x<extra></extra>'
+    ))
     
-    with col1:
-        st.markdown("**🏆 Top 10 by ROAS**")
-        top_roas = df_adsets.nlargest(10, 'roas')[['name', 'spend', 'roas', 'purchases']]
-        
-        fig_roas = go.Figure(go.Bar(
-            y=top_roas['name'].apply(lambda x: x[:50] + '...' if len(x) > 50 else x),
-            x=top_roas['roas'],
-            orientation='h',
-            marker_color='#10B981',
-            text=top_roas['roas'].apply(lambda x: f'{x:.2f}x'),
-            textposition='outside',
-            hovertemplate='<b>%{y}</b><br>ROAS: %{x:.2f}x<extra></extra>'
-        ))
-        
-        fig_roas.update_layout(
-            height=400,
-            xaxis_title="ROAS",
-            yaxis={'categoryorder': 'total ascending'}
-        )
-        
-        st.plotly_chart(fig_roas, use_container_width=True)
+    fig_roas.update_layout(
+        height=400,
+        xaxis_title="ROAS",
+        yaxis={'categoryorder': 'total ascending'}
+    )
     
-    with col2:
-        st.markdown("**💰 Top 10 by Spend**")
-        top_spend = df_adsets.nlargest(10, 'spend')[['name', 'spend', 'roas', 'purchases']]
-        
-        fig_spend = go.Figure(go.Bar(
-            y=top_spend['name'].apply(lambda x: x[:50] + '...' if len(x) > 50 else x),
-            x=top_spend['spend'],
-            orientation='h',
-            marker_color='#2563EB',
-            text=top_spend['spend'].apply(lambda x: f'${x:,.0f}'),
-            textposition='outside',
-            hovertemplate='<b>%{y}</b><br>Spend: $%{x:,.0f}<extra></extra>'
-        ))
-        
-        fig_spend.update_layout(
-            height=400,
-            xaxis_title="Spend ($)",
-            yaxis={'categoryorder': 'total ascending'}
-        )
-        
-        st.plotly_chart(fig_spend, use_container_width=True)
+    return fig_roas
+
+@st.cache_resource(ttl=300)
+def build_top_spend_fig(cache_key, _df_adsets):
+    """Plotly figure for the top 10 ad sets by spend"""
+    import plotly.graph_objects as go
     
-    # Scatter plot: Spend vs ROAS
-    st.markdown("### 💡 Spend vs ROAS Analysis")
+    top_spend = top_n(_df_adsets, 'spend', 10)[['name', 'spend', 'roas', 'purchases']]
+    
+    fig_spend = go.Figure(go.Bar(
+        y=truncate_names(top_spend['name'], 50),
+        x=top_spend['spend'],
+        orientation='h',
+        marker_color='#2563EB',
+        text=top_spend['spend'].apply(lambda x: f'${x:,.0f}'),
+        textposition='outside',
+        hovertemplate='<b>%{y}</b><br>Spend: $%{x:,.0f}<extra></extra>'
+    ))
+    
+    fig_spend.update_layout(
+        height=400,
+        xaxis_title="Spend ($)",
+        yaxis={'categoryorder': 'total ascending'}
+    )
+    
+    return fig_spend
+
+@st.cache_resource(ttl=300)
+def build_scatter_fig(cache_key, _df_adsets):
+    """Plotly figure for the Spend vs ROAS scatter, capped to MAX_SCATTER_POINTS ad sets"""
+    import plotly.graph_objects as go
     
-    fig_scatter = go.Figure(go.Scatter(
-        x=df_adsets['spend'],
-        y=df_adsets['roas'],
+    # Large reports are capped so the browser isn't handed thousands of markers
+    if len(_df_adsets) > MAX_SCATTER_POINTS:
+        df_scatter = top_n(_df_adsets, 'spend', MAX_SCATTER_POINTS)
+    else:
+        df_scatter = _df_adsets
+    
+    # WebGL rendering keeps large marker counts responsive
+    fig_scatter = go.Figure(go.Scattergl(
+        x=df_scatter['spend'],
+        y=df_scatter['roas'],
         mode='markers',
         marker=dict(
-            size=df_adsets['purchases'] * 2,  # Size by purchases
-            color=df_adsets['cost_purchase'],
+            size=df_scatter['purchases'] * 2,  # Size by purchases
+            color=df_scatter['cost_purchase'],
             colorscale='RdYlGn_r',
             showscale=True,
             colorbar=dict(title="Cost/Purchase")
         ),
-        text=df_adsets['name'].apply(lambda x: x[:60] + '...' if len(x) > 60 else x),
+        text=truncate_names(df_scatter['name'], 60),
         hovertemplate='<b>%{text}</b><br>Spend: $%{x:,.0f}<br>ROAS: %{y:.2f}x<extra></extra>'
     ))
     
@@ -378,22 +510,58 @@ if data['all_adsets']:
         height=500
     )
     
-    st.plotly_chart(fig_scatter, use_container_width=True)
+    return fig_scatter
+
+@st.fragment
+def render_top10(cache_key, df_adsets):
+    """Side-by-side top 10 ad sets by ROAS and by spend"""
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("**🏆 Top 10 by ROAS**")
+        st.plotly_chart(build_top_roas_fig(cache_key, df_adsets), use_container_width=True)
+    
+    with col2:
+        st.markdown("**💰 Top 10 by Spend**")
+        st.plotly_chart(build_top_spend_fig(cache_key, df_adsets), use_container_width=True)
+
+@st.fragment
+def render_scatter(cache_key, df_adsets):
+    """Spend vs ROAS scatter, bubble size = purchases"""
+    st.markdown("### 💡 Spend vs ROAS Analysis")
+    
+    if len(df_adsets) > MAX_SCATTER_POINTS:
+        st.caption(f"Showing the top {MAX_SCATTER_POINTS:,} of {len(df_adsets):,} ad sets by spend")
+    
+    st.plotly_chart(build_scatter_fig(cache_key, df_adsets), use_container_width=True)
+
+if not data['all_adsets'].empty:
+    st.subheader("📈 Ad Set Performance Analysis")
+    
+    df_adsets = data['all_adsets']
+    
+    # Top performers
+    render_top10(cache_key, df_adsets)
+    
+    # Scatter plot: Spend vs ROAS
+    render_scatter(cache_key, df_adsets)
     
     # Performance table
     st.markdown("### 📋 Detailed Ad Set Performance")
     
     display_df = df_adsets[['name', 'status', 'spend', 'purchases', 'cost_purchase', 'roas', 'atc', 'ic']].copy()
     display_df.columns = ['Ad Set', 'Status', 'Spend', 'Purchases', 'Cost/Purchase', 'ROAS', 'ATC', 'IC']
-    display_df['Spend'] = display_df['Spend'].apply(lambda x: f'${x:,.2f}')
-    display_df['Cost/Purchase'] = display_df['Cost/Purchase'].apply(lambda x: f'${x:.2f}')
-    display_df['ROAS'] = display_df['ROAS'].apply(lambda x: f'{x:.2f}x')
     
     st.dataframe(
         display_df,
         use_container_width=True,
         hide_index=True,
-        height=600
+        height=600,
+        column_config=number_columns({
+            'Spend': '$%.2f',
+            'Cost/Purchase': '$%.2f',
+            'ROAS': '%.2fx'
+        })
     )
 
 # ============================================================================
@@ -402,11 +570,10 @@ if data['all_adsets']:
 
 st.markdown("---")
 
-if data['all_adsets']:
-    csv = pd.DataFrame(data['all_adsets']).to_csv(index=False)
+if not data['all_adsets'].empty:
     st.download_button(
         label="📥 Download Ad Set Data (CSV)",
-        data=csv,
+        data=csv_bytes(cache_key, data['all_adsets']),
         file_name=f"adset_testing_{datetime.now().strftime('%Y%m%d')}.csv",
         mime="text/csv"
     )
@@ -414,6 +581,6 @@ if data['all_adsets']:
 st.caption(
     f"Built with Streamlit {st.__version__} • "
     f"Eskiin Ad Set Testing Analytics • "
-    f"Last refresh: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    f"Last refresh: {st.session_state.last_refresh.strftime('%Y-%m-%d %H:%M:%S')}"
 )
 
@@ -0,0 +1,81 @@
+"""
+Eskiin Analytics Dashboard - shared helpers
+Report data types and helpers used by the dashboard pages
+
+Page scripts run as __main__, so anything Streamlit has to pickle (cache_data
+return values) must be defined here rather than in a page.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# ============================================================================
+# Report Loading
+# ============================================================================
+
+# Removes currency, thousands separator and ROAS suffix characters in one pass
+NUMBER_STRIP = str.maketrans('', '', '$,x')
+
+def upload_digest(uploaded_file):
+    """BLAKE2b digest of an uploaded file, hashed from its buffer without a copy"""
+    return hashlib.blake2b(uploaded_file.getbuffer(), digest_size=16).hexdigest()
+
+def session_report(state_key, report_key, load):
+    """The page's last parsed report, kept in the session and replaced via load() when report_key changes"""
+    cached_key, data = st.session_state.get(state_key, (None, None))
+    if cached_key != report_key:
+        data = load()
+        st.session_state[state_key] = (report_key, data)
+    return data
+
+# ============================================================================
+# Display
+# ============================================================================
+
+def truncate_names(names, n):
+    """Vectorized label truncation: names longer than n characters are cut with '...'"""
+    return np.where(names.str.len() > n, names.str.slice(0, n) + '...', names)
+
+def number_columns(formats):
+    """st.dataframe column config that formats numbers in the browser, so the columns stay numeric"""
+    return {label: st.column_config.NumberColumn(label, format=fmt) for label, fmt in formats.items()}
+
+@st.cache_data(ttl=300)
+def csv_bytes(report_key, _df):
+    """CSV export of a report table, serialized once per report rather than on every rerun"""
+    return _df.to_csv(index=False).encode('utf-8')
+
+# ============================================================================
+# Creative Report
+# ============================================================================
+
+# Numeric top performer fields, in the order their raw cells are collected
+PERFORMER_NUMERIC_FIELDS = [
+    'rank', 'cost_per_purchase', 'spend', 'content_views', 'adds_to_cart',
+    'checkouts', 'purchases', 'roas', 'hook_rate'
+]
+PERFORMER_INT_FIELDS = ['rank', 'content_views', 'adds_to_cart', 'checkouts', 'purchases']
+PERFORMER_COLUMNS = [
+    'rank', 'cost_per_purchase', 'name', 'spend', 'content_views', 'adds_to_cart',
+    'checkouts', 'purchases', 'roas', 'hook_rate'
+]
+
+# Numeric location table fields, in table order
+LOCATION_NUMERIC_FIELDS = ['videos', 'purchases', 'cost_per_purchase', 'spend']
+LOCATION_INT_FIELDS = ['videos', 'purchases']
+LOCATION_COLUMNS = ['location'] + LOCATION_NUMERIC_FIELDS
+
+@dataclass(slots=True)
+class ReportData:
+    """Parsed creative report; sections missing from the report stay empty"""
+    metadata: dict = field(default_factory=dict)
+    executive_summary: dict = field(default_factory=dict)
+    conversion_metrics: dict = field(default_factory=dict)
+    top_performers: pd.DataFrame = field(default_factory=lambda: pd.DataFrame(columns=PERFORMER_COLUMNS))
+    locations: pd.DataFrame = field(default_factory=lambda: pd.DataFrame(columns=LOCATION_COLUMNS))
+    # Metric display strings, filled in by load_report
+    display: dict = field(default_factory=dict)
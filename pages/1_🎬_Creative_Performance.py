@@ -18,13 +18,17 @@ Deploy to Streamlit Cloud:
 
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+import numpy as np
 from pathlib import Path
-import re
+import regex
+import re2
 from datetime import datetime
-import io
+import mmap
+from dashboard_utils import (
+    PERFORMER_NUMERIC_FIELDS, PERFORMER_INT_FIELDS, PERFORMER_COLUMNS,
+    LOCATION_NUMERIC_FIELDS, LOCATION_INT_FIELDS, LOCATION_COLUMNS, ReportData,
+    NUMBER_STRIP, upload_digest, session_report, truncate_names, number_columns, csv_bytes
+)
 
 # ============================================================================
 # Page Configuration
@@ -49,6 +53,8 @@ def is_local_mode():
 # Sample/Demo Data Generator
 # ============================================================================
 
+# The demo report never changes, so one shared copy serves every session
+@st.cache_resource
 def generate_demo_report():
     """Generate a demo markdown report for testing"""
     return """# 🎬 Eskiin - Creative Performance Report
@@ -134,140 +140,185 @@ def generate_demo_report():
 # Data Loading & Parsing
 # ============================================================================
 
-@st.cache_data(ttl=300)
+# Patterns are compiled once at import rather than looked up on every parse.
+# Numeric captures and table rows use possessive quantifiers / atomic groups
+# from the regex module so a near-miss fails without backtracking through them.
+
+# Metadata & executive summary
+_RE_DATE_RANGE = regex.compile(r'\*\*Date Range:\*\* (.+?) \((\d++) days\)')
+_RE_GENERATED = regex.compile(r'\*\*Generated:\*\* (.++)$', regex.MULTILINE)
+_RE_TOTAL_ADS = regex.compile(r'- \*\*(\d++) ads\*\* analyzed')
+_RE_TOTAL_SPEND = regex.compile(r'- \*\*\$([0-9,\.]++)\*\* total spend')
+_RE_HOOK_RATE = regex.compile(r'- \*\*([0-9\.]++)%\*\* hook rate \(([0-9,]++) plays / ([0-9,]++) impressions\)')
+_RE_VIDEOS_ANALYZED = regex.compile(r'- \*\*(\d++) videos\*\* analyzed with AI')
+
+# Conversion performance section
+_RE_CONVERSIONS_SECTION = regex.compile(r'### 💰 Conversion Performance\n\n(.+?)\n\n---', regex.DOTALL)
+_RE_CONV_CONTENT_VIEWS = regex.compile(r'- \*\*Content Views:\*\* ([0-9,]++) \(\$([0-9,\.]++) per view\)')
+_RE_CONV_ADDS_TO_CART = regex.compile(r'- \*\*Adds to Cart:\*\* ([0-9,]++) \(\$([0-9,\.]++) per add\)')
+_RE_CONV_CHECKOUTS = regex.compile(r'- \*\*Initiate Checkout:\*\* ([0-9,]++) \(\$([0-9,\.]++) per checkout\)')
+_RE_CONV_PURCHASES = regex.compile(r'- \*\*Purchases:\*\* ([0-9,]++) \(\$([0-9,\.]++) per purchase\)')
+_RE_CONV_ROAS = regex.compile(r'- \*\*ROAS:\*\* ([0-9\.]++)x')
+
+# Top performer sections. The split runs over the whole report, so it uses RE2's
+# linear-time engine instead of the backtracking one.
+_RE_PERFORMER_SPLIT = re2.compile(r'###\s+#(\d+)\.\s+Lowest Cost Per Purchase:\s+\$([0-9,\.]+)')
+_RE_PERFORMER_NAME = regex.compile(r'^\n\*\*(.+?)\*\*')
+_RE_PERFORMER_SPEND = regex.compile(r'\*\*💰 Spend:\*\* \$([0-9,\.]++)')
+_RE_PERFORMER_CONTENT_VIEWS = regex.compile(r'- \*\*Content Views:\*\* ([0-9,]++)')
+_RE_PERFORMER_ADDS_TO_CART = regex.compile(r'- \*\*Add to Cart:\*\* ([0-9,]++)')
+_RE_PERFORMER_CHECKOUTS = regex.compile(r'- \*\*Initiate Checkout:\*\* ([0-9,]++)')
+_RE_PERFORMER_PURCHASES = regex.compile(r'- \*\*Purchases:\*\* ([0-9,]++)')
+_RE_PERFORMER_ROAS = regex.compile(r'\*\*📈 ROAS:\*\* ([0-9\.]++)x')
+_RE_PERFORMER_HOOK_RATE = regex.compile(r'\*\*🎣 Hook Rate:\*\* ([0-9\.]++)%')
+
+# Location performance table
+_RE_LOCATION_TABLE = regex.compile(
+    r'\|\| Location \| Videos \| Purchases \| Cost/Purchase \| Spend \|\n'
+    r'\|\|----------\|--------\|-----------\|---------------\|-------\|\n'
+    r'((?>\|\|.+?\|\n)++)'
+)
+
+def numeric_frame(raw, fields, int_fields):
+    """Cast a flat list of cleaned numeric cells (len(fields) per row) in one step; int_fields must be whole"""
+    values = np.array(raw, dtype=np.float64).reshape(-1, len(fields))
+    return pd.DataFrame({
+        name: values[:, i].astype(np.int64) if name in int_fields else values[:, i]
+        for i, name in enumerate(fields)
+    })
+
 def parse_creative_report(content):
     """
     Parse the creative team report markdown content
-    Returns: dict with executive summary, top performers, and location data
+    Returns: ReportData with executive summary, top performers, and location data
     """
-    data = {
-        'metadata': {},
-        'executive_summary': {},
-        'conversion_metrics': {},
-        'top_performers': [],
-        'locations': []
-    }
+    data = ReportData()
     
     # Extract metadata (date range, generated date)
-    date_range_match = re.search(r'\*\*Date Range:\*\* (.+?) \((\d+) days\)', content)
+    date_range_match = _RE_DATE_RANGE.search(content)
     if date_range_match:
-        data['metadata']['date_range'] = date_range_match.group(1)
-        data['metadata']['days'] = int(date_range_match.group(2))
+        data.metadata['date_range'] = date_range_match.group(1)
+        data.metadata['days'] = int(date_range_match.group(2))
     
-    generated_match = re.search(r'\*\*Generated:\*\* (.+?)$', content, re.MULTILINE)
+    generated_match = _RE_GENERATED.search(content)
     if generated_match:
-        data['metadata']['generated'] = generated_match.group(1)
+        data.metadata['generated'] = generated_match.group(1)
     
     # Extract executive summary
-    ads_match = re.search(r'- \*\*(\d+) ads\*\* analyzed', content)
+    ads_match = _RE_TOTAL_ADS.search(content)
     if ads_match:
-        data['executive_summary']['total_ads'] = int(ads_match.group(1).replace(',', ''))
+        data.executive_summary['total_ads'] = int(ads_match.group(1).replace(',', ''))
     
-    spend_match = re.search(r'- \*\*\$([0-9,\.]+)\*\* total spend', content)
+    spend_match = _RE_TOTAL_SPEND.search(content)
     if spend_match:
-        data['executive_summary']['total_spend'] = float(spend_match.group(1).replace(',', ''))
+        data.executive_summary['total_spend'] = float(spend_match.group(1).replace(',', ''))
     
-    hook_match = re.search(r'- \*\*([0-9\.]+)%\*\* hook rate \(([0-9,]+) plays / ([0-9,]+) impressions\)', content)
+    hook_match = _RE_HOOK_RATE.search(content)
     if hook_match:
-        data['executive_summary']['hook_rate'] = float(hook_match.group(1))
-        data['executive_summary']['plays'] = int(hook_match.group(2).replace(',', ''))
-        data['executive_summary']['impressions'] = int(hook_match.group(3).replace(',', ''))
+        data.executive_summary['hook_rate'] = float(hook_match.group(1))
+        data.executive_summary['plays'] = int(hook_match.group(2).replace(',', ''))
+        data.executive_summary['impressions'] = int(hook_match.group(3).replace(',', ''))
     
-    videos_match = re.search(r'- \*\*(\d+) videos\*\* analyzed with AI', content)
+    videos_match = _RE_VIDEOS_ANALYZED.search(content)
     if videos_match:
-        data['executive_summary']['videos_analyzed'] = int(videos_match.group(1))
+        data.executive_summary['videos_analyzed'] = int(videos_match.group(1))
     
     # Extract conversion metrics
-    conversions_section = re.search(r'### 💰 Conversion Performance\n\n(.+?)\n\n---', content, re.DOTALL)
+    conversions_section = _RE_CONVERSIONS_SECTION.search(content)
     if conversions_section:
         conv_text = conversions_section.group(1)
         
-        content_views = re.search(r'- \*\*Content Views:\*\* ([0-9,]+) \(\$([0-9,\.]+) per view\)', conv_text)
+        content_views = _RE_CONV_CONTENT_VIEWS.search(conv_text)
         if content_views:
-            data['conversion_metrics']['content_views'] = int(content_views.group(1).replace(',', ''))
-            data['conversion_metrics']['cost_per_content_view'] = float(content_views.group(2).replace(',', ''))
+            data.conversion_metrics['content_views'] = int(content_views.group(1).replace(',', ''))
+            data.conversion_metrics['cost_per_content_view'] = float(content_views.group(2).replace(',', ''))
         
-        atc = re.search(r'- \*\*Adds to Cart:\*\* ([0-9,]+) \(\$([0-9,\.]+) per add\)', conv_text)
+        atc = _RE_CONV_ADDS_TO_CART.search(conv_text)
         if atc:
-            data['conversion_metrics']['adds_to_cart'] = int(atc.group(1).replace(',', ''))
-            data['conversion_metrics']['cost_per_atc'] = float(atc.group(2).replace(',', ''))
+            data.conversion_metrics['adds_to_cart'] = int(atc.group(1).replace(',', ''))
+            data.conversion_metrics['cost_per_atc'] = float(atc.group(2).replace(',', ''))
         
-        checkout = re.search(r'- \*\*Initiate Checkout:\*\* ([0-9,]+) \(\$([0-9,\.]+) per checkout\)', conv_text)
+        checkout = _RE_CONV_CHECKOUTS.search(conv_text)
         if checkout:
-            data['conversion_metrics']['checkouts'] = int(checkout.group(1).replace(',', ''))
-            data['conversion_metrics']['cost_per_checkout'] = float(checkout.group(2).replace(',', ''))
+            data.conversion_metrics['checkouts'] = int(checkout.group(1).replace(',', ''))
+            data.conversion_metrics['cost_per_checkout'] = float(checkout.group(2).replace(',', ''))
         
-        purchases = re.search(r'- \*\*Purchases:\*\* ([0-9,]+) \(\$([0-9,\.]+) per purchase\)', conv_text)
+        purchases = _RE_CONV_PURCHASES.search(conv_text)
         if purchases:
-            data['conversion_metrics']['purchases'] = int(purchases.group(1).replace(',', ''))
-            data['conversion_metrics']['cost_per_purchase'] = float(purchases.group(2).replace(',', ''))
+            data.conversion_metrics['purchases'] = int(purchases.group(1).replace(',', ''))
+            data.conversion_metrics['cost_per_purchase'] = float(purchases.group(2).replace(',', ''))
         
-        roas = re.search(r'- \*\*ROAS:\*\* ([0-9\.]+)x', conv_text)
+        roas = _RE_CONV_ROAS.search(conv_text)
         if roas:
-            data['conversion_metrics']['roas'] = float(roas.group(1))
+            data.conversion_metrics['roas'] = float(roas.group(1))
     
     # Extract top performers - more flexible pattern
-    performer_sections = re.split(r'###\s+#(\d+)\.\s+Lowest Cost Per Purchase:\s+\$([0-9,\.]+)', content)
+    performer_sections = _RE_PERFORMER_SPLIT.split(content)
     
-    # Process each top performer section
+    # Process each top performer section. Numeric cells are only collected here
+    # and cast together once all sections have been read.
+    performer_names = []
+    performer_cells = []
     for i in range(1, len(performer_sections), 3):
         if i+2 < len(performer_sections):
-            rank = int(performer_sections[i])
-            cpp = float(performer_sections[i+1].replace(',', ''))
             section = performer_sections[i+2]
             
             # Extract data from this section
-            name_match = re.search(r'^\n\*\*(.+?)\*\*', section)
-            spend_match = re.search(r'\*\*💰 Spend:\*\* \$([0-9,\.]+)', section)
-            cv_match = re.search(r'- \*\*Content Views:\*\* ([0-9,]+)', section)
-            atc_match = re.search(r'- \*\*Add to Cart:\*\* ([0-9,]+)', section)
-            ic_match = re.search(r'- \*\*Initiate Checkout:\*\* ([0-9,]+)', section)
-            purchases_match = re.search(r'- \*\*Purchases:\*\* ([0-9,]+)', section)
-            roas_match = re.search(r'\*\*📈 ROAS:\*\* ([0-9\.]+)x', section)
-            hook_match = re.search(r'\*\*🎣 Hook Rate:\*\* ([0-9\.]+)%', section)
+            name_match = _RE_PERFORMER_NAME.search(section)
+            spend_match = _RE_PERFORMER_SPEND.search(section)
+            cv_match = _RE_PERFORMER_CONTENT_VIEWS.search(section)
+            atc_match = _RE_PERFORMER_ADDS_TO_CART.search(section)
+            ic_match = _RE_PERFORMER_CHECKOUTS.search(section)
+            purchases_match = _RE_PERFORMER_PURCHASES.search(section)
+            roas_match = _RE_PERFORMER_ROAS.search(section)
+            hook_match = _RE_PERFORMER_HOOK_RATE.search(section)
             
             if all([name_match, spend_match, cv_match, atc_match, ic_match, purchases_match, roas_match, hook_match]):
-                performer = {
-                    'rank': rank,
-                    'cost_per_purchase': cpp,
-                    'name': name_match.group(1).strip(),
-                    'spend': float(spend_match.group(1).replace(',', '')),
-                    'content_views': int(cv_match.group(1).replace(',', '')),
-                    'adds_to_cart': int(atc_match.group(1).replace(',', '')),
-                    'checkouts': int(ic_match.group(1).replace(',', '')),
-                    'purchases': int(purchases_match.group(1).replace(',', '')),
-                    'roas': float(roas_match.group(1)),
-                    'hook_rate': float(hook_match.group(1))
-                }
-                data['top_performers'].append(performer)
+                performer_names.append(name_match.group(1).strip())
+                performer_cells.extend([
+                    performer_sections[i],
+                    performer_sections[i+1].translate(NUMBER_STRIP),
+                    spend_match.group(1).translate(NUMBER_STRIP),
+                    cv_match.group(1).translate(NUMBER_STRIP),
+                    atc_match.group(1).translate(NUMBER_STRIP),
+                    ic_match.group(1).translate(NUMBER_STRIP),
+                    purchases_match.group(1).translate(NUMBER_STRIP),
+                    roas_match.group(1),
+                    hook_match.group(1)
+                ])
+    
+    # The count patterns only match digits and commas, so the int fields are whole
+    if performer_names:
+        performers = numeric_frame(performer_cells, PERFORMER_NUMERIC_FIELDS, PERFORMER_INT_FIELDS)
+        performers['name'] = performer_names
+        data.top_performers = performers[PERFORMER_COLUMNS]
     
     # Extract location performance (optional)
-    location_section = re.search(
-        r'\|\| Location \| Videos \| Purchases \| Cost/Purchase \| Spend \|\n'
-        r'\|\|----------|--------|-----------|---------------|-------\|\n'
-        r'((?:\|\|.+?\|\n)+)',
-        content
-    )
+    location_section = _RE_LOCATION_TABLE.search(content)
     
     if location_section and location_section.group(1):
-        try:
-            location_rows = location_section.group(1).strip().split('\n')
-            for row in location_rows:
-                parts = [p.strip() for p in row.split('|') if p.strip()]
-                if len(parts) >= 5:
-                    try:
-                        data['locations'].append({
-                            'location': parts[0],
-                            'videos': int(parts[1]),
-                            'purchases': int(parts[2]),
-                            'cost_per_purchase': float(parts[3].replace('$', '').replace(',', '')),
-                            'spend': float(parts[4].replace('$', '').replace(',', ''))
-                        })
-                    except ValueError:
-                        continue
-        except AttributeError:
-            # Location section not found or malformed - skip it
-            pass
+        location_names = []
+        location_cells = []
+        for row in location_section.group(1).strip().split('\n'):
+            parts = [p.strip() for p in row.split('|') if p.strip()]
+            if len(parts) >= 5:
+                location_names.append(parts[0])
+                location_cells.extend(p.translate(NUMBER_STRIP) for p in parts[1:5])
+        
+        if location_names:
+            # Rows with an unparseable cell, or a fractional count, are skipped,
+            # so cast to NaN first and filter
+            cells = pd.to_numeric(pd.Series(location_cells, dtype=object), errors='coerce').to_numpy()
+            cells = cells.reshape(-1, len(LOCATION_NUMERIC_FIELDS))
+            int_cells = cells[:, [LOCATION_NUMERIC_FIELDS.index(name) for name in LOCATION_INT_FIELDS]]
+            valid = ~np.isnan(cells).any(axis=1) & (int_cells % 1 == 0).all(axis=1)
+            locations = numeric_frame(
+                cells[valid].ravel(),
+                LOCATION_NUMERIC_FIELDS,
+                LOCATION_INT_FIELDS
+            )
+            locations['location'] = np.array(location_names, dtype=object)[valid]
+            data.locations = locations[LOCATION_COLUMNS]
     
     return data
 
@@ -331,6 +382,7 @@ with st.sidebar:
     # Refresh button
     if st.button("🔄 Refresh Data", type="primary"):
         st.cache_data.clear()
+        st.session_state.pop('creative_report', None)
         st.rerun()
     
     st.markdown("---")
@@ -365,21 +417,69 @@ if selected_source is None:
     st.warning("⬅️ Please select a data source from the sidebar to continue")
     st.stop()
 
-try:
-    if selected_source == "demo":
+@st.cache_resource(max_entries=4)
+def read_local_report(path, mtime_ns, size):
+    """Text of a local report, kept until the file's mtime or size changes"""
+    # Decoded straight from the memory map; newlines normalized as text mode would
+    if not size:
+        return ''
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return str(mm, 'utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+@st.cache_data(ttl=300, max_entries=16, show_spinner="Parsing report…")
+def load_report(report_key, _source, _file):
+    """Read and parse the selected report, cached on report_key so the content is never hashed"""
+    if _source == "demo":
         # Load demo data
         report_content = generate_demo_report()
-        st.info("📊 Viewing **Demo Data** - Upload your own report for real insights!")
-    elif selected_source == "upload":
+    elif _source == "upload":
         # Read uploaded file
-        report_content = selected_file.read().decode('utf-8')
-        st.success(f"✅ Loaded uploaded report: **{selected_file.name}**")
+        report_content = _file.read().decode('utf-8')
     else:  # local_file
         # Read local file
-        with open(selected_file, 'r', encoding='utf-8') as f:
-            report_content = f.read()
+        stat = _file.stat()
+        report_content = read_local_report(str(_file), stat.st_mtime_ns, stat.st_size)
     
     data = parse_creative_report(report_content)
+    
+    # Metric display strings are formatted once per report instead of on every rerun
+    summary = data.executive_summary
+    conv = data.conversion_metrics
+    data.display = {
+        'total_ads': f"{summary.get('total_ads', 0):,}",
+        'total_spend': f"${summary.get('total_spend', 0):,.2f}",
+        'hook_rate': f"{summary.get('hook_rate', 0):.1f}%",
+        'videos_analyzed': f"{summary.get('videos_analyzed', 0):,}",
+        'content_views': f"{conv.get('content_views', 0):,}",
+        'cost_per_content_view': f"${conv.get('cost_per_content_view', 0):.2f} per view",
+        'adds_to_cart': f"{conv.get('adds_to_cart', 0):,}",
+        'cost_per_atc': f"${conv.get('cost_per_atc', 0):.2f} per add",
+        'checkouts': f"{conv.get('checkouts', 0):,}",
+        'cost_per_checkout': f"${conv.get('cost_per_checkout', 0):.2f} per checkout",
+        'purchases': f"{conv.get('purchases', 0):,}",
+        'cost_per_purchase': f"${conv.get('cost_per_purchase', 0):.2f} per purchase",
+        'roas': f"{conv.get('roas', 0):.2f}x",
+    }
+    
+    return data
+
+try:
+    if selected_source == "demo":
+        report_key = ('creative', 'demo')
+        st.info("📊 Viewing **Demo Data** - Upload your own report for real insights!")
+    elif selected_source == "upload":
+        report_key = ('creative', upload_digest(selected_file))
+        st.success(f"✅ Loaded uploaded report: **{selected_file.name}**")
+    else:  # local_file
+        stat = selected_file.stat()
+        report_key = ('creative', str(selected_file), stat.st_mtime_ns, stat.st_size)
+    
+    data = session_report(
+        'creative_report',
+        report_key,
+        lambda: load_report(report_key, selected_source, selected_file)
+    )
+    
     data_loaded = True
     
 except Exception as e:
@@ -397,10 +497,10 @@ if not data_loaded:
 
 st.title("🎬 Eskiin Creative Performance Dashboard")
 
-if data['metadata'].get('date_range'):
-    st.markdown(f"**Date Range:** {data['metadata']['date_range']}")
-if data['metadata'].get('generated'):
-    st.markdown(f"**Report Generated:** {data['metadata']['generated']}")
+if data.metadata.get('date_range'):
+    st.markdown(f"**Date Range:** {data.metadata['date_range']}")
+if data.metadata.get('generated'):
+    st.markdown(f"**Report Generated:** {data.metadata['generated']}")
 
 st.markdown("---")
 
@@ -410,33 +510,35 @@ st.markdown("---")
 
 st.subheader("📊 Executive Summary")
 
+display = data.display
+
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
     st.metric(
         "Total Ads",
-        f"{data['executive_summary'].get('total_ads', 0):,}",
+        display['total_ads'],
         help="Total number of ads analyzed"
     )
 
 with col2:
     st.metric(
         "Total Spend",
-        f"${data['executive_summary'].get('total_spend', 0):,.2f}",
+        display['total_spend'],
         help="Total ad spend for the period"
     )
 
 with col3:
     st.metric(
         "Hook Rate",
-        f"{data['executive_summary'].get('hook_rate', 0):.1f}%",
+        display['hook_rate'],
         help="Percentage of impressions that resulted in plays"
     )
 
 with col4:
     st.metric(
         "Videos Analyzed",
-        f"{data['executive_summary'].get('videos_analyzed', 0):,}",
+        display['videos_analyzed'],
         help="Number of videos with AI analysis"
     )
 
@@ -450,44 +552,48 @@ st.subheader("💰 Conversion Performance")
 
 col1, col2, col3, col4, col5 = st.columns(5)
 
-conv = data['conversion_metrics']
+conv = data.conversion_metrics
+
+# Each funnel value is looked up once
+stage_counts = [conv.get(key, 0) for key in ('content_views', 'adds_to_cart', 'checkouts', 'purchases')]
+stage_costs = [conv.get(key, 0) for key in ('cost_per_content_view', 'cost_per_atc', 'cost_per_checkout', 'cost_per_purchase')]
 
 with col1:
     st.metric(
         "Content Views",
-        f"{conv.get('content_views', 0):,}",
-        delta=f"${conv.get('cost_per_content_view', 0):.2f} per view",
+        display['content_views'],
+        delta=display['cost_per_content_view'],
         delta_color="inverse"
     )
 
 with col2:
     st.metric(
         "Add to Cart",
-        f"{conv.get('adds_to_cart', 0):,}",
-        delta=f"${conv.get('cost_per_atc', 0):.2f} per add",
+        display['adds_to_cart'],
+        delta=display['cost_per_atc'],
         delta_color="inverse"
     )
 
 with col3:
     st.metric(
         "Checkouts",
-        f"{conv.get('checkouts', 0):,}",
-        delta=f"${conv.get('cost_per_checkout', 0):.2f} per checkout",
+        display['checkouts'],
+        delta=display['cost_per_checkout'],
         delta_color="inverse"
     )
 
 with col4:
     st.metric(
         "Purchases",
-        f"{conv.get('purchases', 0):,}",
-        delta=f"${conv.get('cost_per_purchase', 0):.2f} per purchase",
+        display['purchases'],
+        delta=display['cost_per_purchase'],
         delta_color="inverse"
     )
 
 with col5:
     st.metric(
         "ROAS",
-        f"{conv.get('roas', 0):.2f}x",
+        display['roas'],
         help="Return on Ad Spend"
     )
 
@@ -498,55 +604,60 @@ with col5:
 st.markdown("---")
 st.subheader("🔄 Conversion Funnel")
 
+# Figures are cached per report key as shared go.Figure objects.
+# Side-by-side pairs are combined into one subplot figure.
+@st.cache_resource(ttl=300)
+def build_funnel_fig(report_key, _funnel_data):
+    """Plotly figure for the funnel volume next to the cost per stage"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
+    colors = ['#2563EB', '#10B981', '#F59E0B', '#EF4444']
+    fig = make_subplots(rows=1, cols=2, subplot_titles=("Conversion Funnel Volume", "Cost Per Conversion Stage"))
+    
+    fig.add_trace(go.Funnel(
+        y=_funnel_data['Stage'],
+        x=_funnel_data['Count'],
+        textposition="inside",
+        textinfo="value+percent initial",
+        marker=dict(color=colors),
+        hovertemplate='<b>%{y}</b><br>Count: %{x:,}<br>%{percentInitial}<extra></extra>'
+    ), row=1, col=1)
+    
+    fig.add_trace(go.Bar(
+        x=_funnel_data['Stage'],
+        y=_funnel_data['Cost'],
+        marker=dict(color=colors),
+        text=_funnel_data['Cost'].apply(lambda x: f'${x:.2f}'),
+        textposition='auto',
+        cliponaxis=False,
+        hovertemplate='<b>%{x}</b><br>Cost: $%{y:.2f}<extra></extra>'
+    ), row=1, col=2)
+    
+    fig.update_yaxes(title_text="Cost ($)", row=1, col=2)
+    fig.update_layout(height=400, showlegend=False, uniformtext=dict(minsize=10, mode='hide'))
+    
+    return fig
+
+@st.fragment
+def render_funnel(report_key, stage_counts, stage_costs):
+    """Conversion funnel volume and cost per stage, side by side"""
+    # A report without conversions has nothing to chart
+    if not any(stage_counts):
+        st.info("No conversion data available")
+        return
+    
+    funnel_data = pd.DataFrame({
+        'Stage': ['Content Views', 'Add to Cart', 'Checkouts', 'Purchases'],
+        'Count': stage_counts,
+        'Cost': stage_costs
+    })
+    
+    # Funnel chart and cost per stage
+    st.plotly_chart(build_funnel_fig(report_key, funnel_data), use_container_width=True)
+
 if conv:
-    funnel_data = pd.DataFrame([
-        {'Stage': 'Content Views', 'Count': conv.get('content_views', 0), 'Cost': conv.get('cost_per_content_view', 0)},
-        {'Stage': 'Add to Cart', 'Count': conv.get('adds_to_cart', 0), 'Cost': conv.get('cost_per_atc', 0)},
-        {'Stage': 'Checkouts', 'Count': conv.get('checkouts', 0), 'Cost': conv.get('cost_per_checkout', 0)},
-        {'Stage': 'Purchases', 'Count': conv.get('purchases', 0), 'Cost': conv.get('cost_per_purchase', 0)},
-    ])
-    
-    col_left, col_right = st.columns(2)
-    
-    with col_left:
-        # Funnel chart
-        fig_funnel = go.Figure(go.Funnel(
-            y=funnel_data['Stage'],
-            x=funnel_data['Count'],
-            textposition="inside",
-            textinfo="value+percent initial",
-            marker=dict(
-                color=['#2563EB', '#10B981', '#F59E0B', '#EF4444']
-            ),
-            hovertemplate='<b>%{y}</b><br>Count: %{x:,}<br>%{percentInitial}<extra></extra>'
-        ))
-        
-        fig_funnel.update_layout(
-            title="Conversion Funnel Volume",
-            height=400
-        )
-        
-        st.plotly_chart(fig_funnel, use_container_width=True)
-    
-    with col_right:
-        # Cost per stage
-        fig_cost = go.Figure(go.Bar(
-            x=funnel_data['Stage'],
-            y=funnel_data['Cost'],
-            marker_color=['#2563EB', '#10B981', '#F59E0B', '#EF4444'],
-            text=funnel_data['Cost'].apply(lambda x: f'${x:.2f}'),
-            textposition='outside',
-            hovertemplate='<b>%{x}</b><br>Cost: $%{y:.2f}<extra></extra>'
-        ))
-        
-        fig_cost.update_layout(
-            title="Cost Per Conversion Stage",
-            yaxis_title="Cost ($)",
-            height=400,
-            showlegend=False
-        )
-        
-        st.plotly_chart(fig_cost, use_container_width=True)
+    render_funnel(report_key, stage_counts, stage_costs)
 
 # ============================================================================
 # Top Performers Analysis
@@ -555,71 +666,73 @@ if conv:
 st.markdown("---")
 st.subheader("🏆 Top Performers")
 
-if data['top_performers']:
-    # Top performers dataframe
-    performers_df = pd.DataFrame(data['top_performers'])
-    
-    # Display top 5 comparison
-    top_5 = performers_df.head(5)
-    
-    # Metrics comparison
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Cost per purchase comparison
-        fig_cpp = go.Figure(go.Bar(
-            x=top_5['name'].apply(lambda x: x[:40] + '...' if len(x) > 40 else x),
-            y=top_5['cost_per_purchase'],
-            marker_color='#2563EB',
-            text=top_5['cost_per_purchase'].apply(lambda x: f'${x:.2f}'),
-            textposition='outside',
-            hovertemplate='<b>%{x}</b><br>Cost per Purchase: $%{y:.2f}<extra></extra>'
-        ))
-        
-        fig_cpp.update_layout(
-            title="Cost Per Purchase - Top 5",
-            yaxis_title="Cost ($)",
-            height=400,
-            xaxis_tickangle=-45
-        )
-        
-        st.plotly_chart(fig_cpp, use_container_width=True)
-    
-    with col2:
-        # ROAS comparison
-        fig_roas = go.Figure(go.Bar(
-            x=top_5['name'].apply(lambda x: x[:40] + '...' if len(x) > 40 else x),
-            y=top_5['roas'],
-            marker_color='#10B981',
-            text=top_5['roas'].apply(lambda x: f'{x:.2f}x'),
-            textposition='outside',
-            hovertemplate='<b>%{x}</b><br>ROAS: %{y:.2f}x<extra></extra>'
-        ))
-        
-        fig_roas.update_layout(
-            title="ROAS - Top 5",
-            yaxis_title="ROAS (x)",
-            height=400,
-            xaxis_tickangle=-45
-        )
-        
-        st.plotly_chart(fig_roas, use_container_width=True)
-    
-    # Hook rate vs ROAS scatter
-    st.markdown("### Hook Rate vs ROAS")
+# Performer column -> detailed table heading
+DISPLAY_COLUMNS = {
+    'rank': 'Rank',
+    'name': 'Ad Name',
+    'spend': 'Spend',
+    'purchases': 'Purchases',
+    'cost_per_purchase': 'Cost/Purchase',
+    'roas': 'ROAS',
+    'hook_rate': 'Hook Rate',
+}
+
+@st.cache_resource(ttl=300)
+def build_top5_fig(report_key, _top_5):
+    """Plotly figure for the top 5 cost per purchase next to the top 5 ROAS"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
+    names = truncate_names(_top_5['name'], 40)
+    fig = make_subplots(rows=1, cols=2, subplot_titles=("Cost Per Purchase - Top 5", "ROAS - Top 5"))
+    
+    fig.add_trace(go.Bar(
+        x=names,
+        y=_top_5['cost_per_purchase'],
+        marker=dict(color='#2563EB'),
+        text=_top_5['cost_per_purchase'].apply(lambda x: f'${x:.2f}'),
+        textposition='auto',
+        cliponaxis=False,
+        hovertemplate='<b>%{x}</b><br>Cost per Purchase: $%{y:.2f}<extra></extra>'
+    ), row=1, col=1)
+    
+    fig.add_trace(go.Bar(
+        x=names,
+        y=_top_5['roas'],
+        marker=dict(color='#10B981'),
+        text=_top_5['roas'].apply(lambda x: f'{x:.2f}x'),
+        textposition='auto',
+        cliponaxis=False,
+        hovertemplate='<b>%{x}</b><br>ROAS: %{y:.2f}x<extra></extra>'
+    ), row=1, col=2)
+    
+    fig.update_xaxes(tickangle=-45)
+    fig.update_yaxes(title_text="Cost ($)", row=1, col=1)
+    fig.update_yaxes(title_text="ROAS (x)", row=1, col=2)
+    fig.update_layout(height=400, showlegend=False, uniformtext=dict(minsize=10, mode='hide'))
+    
+    return fig
+
+@st.cache_resource(ttl=300)
+def build_scatter_fig(report_key, _performers_df):
+    """Plotly figure for the hook rate vs ROAS bubble chart"""
+    import plotly.graph_objects as go
+    
+    # Size by spend, clipped so tiny spends stay visible and huge ones don't swamp the chart
+    sizes = np.clip(_performers_df['spend'].to_numpy() / 1000, 4, 40)
     
     fig_scatter = go.Figure(go.Scatter(
-        x=performers_df['hook_rate'],
-        y=performers_df['roas'],
+        x=_performers_df['hook_rate'].to_numpy(),
+        y=_performers_df['roas'].to_numpy(),
         mode='markers',
         marker=dict(
-            size=performers_df['spend'] / 1000,  # Size by spend
-            color=performers_df['cost_per_purchase'],
+            size=sizes,
+            color=_performers_df['cost_per_purchase'].to_numpy(),
             colorscale='RdYlGn_r',
             showscale=True,
             colorbar=dict(title="Cost/Purchase")
         ),
-        text=performers_df['name'].apply(lambda x: x[:50] + '...' if len(x) > 50 else x),
+        text=truncate_names(_performers_df['name'], 50),
         hovertemplate='<b>%{text}</b><br>Hook Rate: %{x:.1f}%<br>ROAS: %{y:.2f}x<extra></extra>'
     ))
     
@@ -630,85 +743,104 @@ if data['top_performers']:
         height=500
     )
     
-    st.plotly_chart(fig_scatter, use_container_width=True)
+    return fig_scatter
+
+@st.fragment
+def render_top_performers(report_key, performers_df):
+    """Top 5 comparisons, the hook rate vs ROAS scatter and the detailed table"""
+    # Display top 5 comparison
+    top_5 = performers_df.head(5)
+    
+    # Cost per purchase and ROAS comparison
+    st.plotly_chart(build_top5_fig(report_key, top_5), use_container_width=True)
+    
+    # Hook rate vs ROAS scatter
+    st.markdown("### Hook Rate vs ROAS")
+    
+    st.plotly_chart(build_scatter_fig(report_key, performers_df), use_container_width=True)
     
     # Detailed table
     st.markdown("### Detailed Performance Table")
     
-    display_df = performers_df[['rank', 'name', 'spend', 'purchases', 'cost_per_purchase', 'roas', 'hook_rate']].copy()
-    display_df.columns = ['Rank', 'Ad Name', 'Spend', 'Purchases', 'Cost/Purchase', 'ROAS', 'Hook Rate']
-    display_df['Spend'] = display_df['Spend'].apply(lambda x: f'${x:,.2f}')
-    display_df['Cost/Purchase'] = display_df['Cost/Purchase'].apply(lambda x: f'${x:.2f}')
-    display_df['ROAS'] = display_df['ROAS'].apply(lambda x: f'{x:.2f}x')
-    display_df['Hook Rate'] = display_df['Hook Rate'].apply(lambda x: f'{x:.1f}%')
+    # Projecting and renaming in one step leaves the numeric columns untouched
+    display_df = performers_df.loc[:, list(DISPLAY_COLUMNS)].rename(columns=DISPLAY_COLUMNS)
     
     st.dataframe(
         display_df,
         use_container_width=True,
         hide_index=True,
-        height=400
+        height=400,
+        column_config=number_columns({
+            'Spend': '$%.2f',
+            'Cost/Purchase': '$%.2f',
+            'ROAS': '%.2fx',
+            'Hook Rate': '%.1f%%'
+        })
     )
 
+if not data.top_performers.empty:
+    render_top_performers(report_key, data.top_performers)
+
 # ============================================================================
 # Location Performance
 # ============================================================================
 
-if data['locations']:
-    st.markdown("---")
-    st.subheader("📍 Location Performance")
-    
-    locations_df = pd.DataFrame(data['locations'])
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Purchases by location
-        fig_loc_purchases = go.Figure(go.Bar(
-            x=locations_df['location'],
-            y=locations_df['purchases'],
-            marker_color='#7C3AED',
-            text=locations_df['purchases'],
-            textposition='outside',
-            hovertemplate='<b>%{x}</b><br>Purchases: %{y:,}<extra></extra>'
-        ))
-        
-        fig_loc_purchases.update_layout(
-            title="Purchases by Location",
-            yaxis_title="Purchases",
-            height=400,
-            xaxis_tickangle=-45
-        )
-        
-        st.plotly_chart(fig_loc_purchases, use_container_width=True)
-    
-    with col2:
-        # Cost per purchase by location
-        fig_loc_cpp = go.Figure(go.Bar(
-            x=locations_df['location'],
-            y=locations_df['cost_per_purchase'],
-            marker_color='#F59E0B',
-            text=locations_df['cost_per_purchase'].apply(lambda x: f'${x:.2f}'),
-            textposition='outside',
-            hovertemplate='<b>%{x}</b><br>Cost/Purchase: $%{y:.2f}<extra></extra>'
-        ))
-        
-        fig_loc_cpp.update_layout(
-            title="Cost Per Purchase by Location",
-            yaxis_title="Cost ($)",
-            height=400,
-            xaxis_tickangle=-45
-        )
-        
-        st.plotly_chart(fig_loc_cpp, use_container_width=True)
+@st.cache_resource(ttl=300)
+def build_locations_fig(report_key, _locations_df):
+    """Plotly figure for purchases next to cost per purchase by location"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
+    fig = make_subplots(rows=1, cols=2, subplot_titles=("Purchases by Location", "Cost Per Purchase by Location"))
+    
+    fig.add_trace(go.Bar(
+        x=_locations_df['location'],
+        y=_locations_df['purchases'],
+        marker=dict(color='#7C3AED'),
+        text=_locations_df['purchases'],
+        textposition='auto',
+        cliponaxis=False,
+        hovertemplate='<b>%{x}</b><br>Purchases: %{y:,}<extra></extra>'
+    ), row=1, col=1)
+    
+    fig.add_trace(go.Bar(
+        x=_locations_df['location'],
+        y=_locations_df['cost_per_purchase'],
+        marker=dict(color='#F59E0B'),
+        text=_locations_df['cost_per_purchase'].apply(lambda x: f'${x:.2f}'),
+        textposition='auto',
+        cliponaxis=False,
+        hovertemplate='<b>%{x}</b><br>Cost/Purchase: $%{y:.2f}<extra></extra>'
+    ), row=1, col=2)
+    
+    fig.update_xaxes(tickangle=-45)
+    fig.update_yaxes(title_text="Purchases", row=1, col=1)
+    fig.update_yaxes(title_text="Cost ($)", row=1, col=2)
+    fig.update_layout(height=400, showlegend=False, uniformtext=dict(minsize=10, mode='hide'))
+    
+    return fig
+
+@st.fragment
+def render_locations(report_key, locations_df):
+    """Purchases and cost per purchase by location, plus the best location callout"""
+    # Purchases and cost per purchase by location
+    st.plotly_chart(build_locations_fig(report_key, locations_df), use_container_width=True)
     
     # Best location callout
-    best_location = locations_df.loc[locations_df['cost_per_purchase'].idxmin()]
+    cost_per_purchase = locations_df['cost_per_purchase'].to_numpy()
+    best_idx = int(cost_per_purchase.argmin())
     
     st.success(
-        f"🎯 **Winner:** {best_location['location']} delivers the best ROI at "
-        f"${best_location['cost_per_purchase']:.2f} per purchase!"
+        f"🎯 **Winner:** {locations_df['location'].iat[best_idx]} delivers the best ROI at "
+        f"${cost_per_purchase[best_idx]:.2f} per purchase!"
     )
 
+if not data.locations.empty:
+    st.markdown("---")
+    st.subheader("📍 Location Performance")
+    
+    render_locations(report_key, data.locations)
+
 # ============================================================================
 # Footer
 # ============================================================================
@@ -716,11 +848,10 @@ if data['locations']:
 st.markdown("---")
 
 # Add download button for the report data
-if data['top_performers']:
-    performers_csv = pd.DataFrame(data['top_performers']).to_csv(index=False)
+if not data.top_performers.empty:
     st.download_button(
         label="📥 Download Performance Data (CSV)",
-        data=performers_csv,
+        data=csv_bytes(report_key, data.top_performers),
         file_name=f"creative_performance_{datetime.now().strftime('%Y%m%d')}.csv",
         mime="text/csv"
     )